@@ -1,8 +1,9 @@
 """Data models for 19hz MCP server."""
 
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Mapping, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
 
 class Region(BaseModel):
@@ -18,7 +19,15 @@ class Region(BaseModel):
         return f"https://19hz.info/{self.filename}"
 
 
-class Event(BaseModel):
+class _SearchBlobSlot:
+    """Slot for Event's precomputed search text, kept out of its fields."""
+
+    __slots__ = ("_search_blob",)
+    _search_blob: str
+
+
+@dataclass(slots=True, frozen=True)
+class Event(_SearchBlobSlot):
     """Represents an electronic music event."""
 
     date: str
@@ -26,21 +35,32 @@ class Event(BaseModel):
     title: str
     venue: str
     location: str
-    genres: list[str] = Field(default_factory=list)
+    genres: list[str] = field(default_factory=list)
     price: Optional[str] = None
     age_restriction: Optional[str] = None
-    organizers: list[str] = Field(default_factory=list)
+    organizers: list[str] = field(default_factory=list)
     url: Optional[str] = None  # Primary URL (from title)
-    additional_links: dict[str, str] = Field(default_factory=dict)  # Link text -> URL
+    # Link text -> URL; read-only, may be the parser's shared empty mapping
+    additional_links: Mapping[str, str] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Precompute the lowercased text used by matches_search."""
+        # Newline-separated so a search term can't match across two fields
+        blob = "\n".join([self.title, self.venue, *self.genres, *self.organizers])
+        object.__setattr__(self, "_search_blob", blob.lower())
 
     def format_markdown(self) -> str:
         """Format event as markdown."""
-        lines = [
-            f"## {self.title}",
-            f"**Date:** {self.date}",
-            f"**Time:** {self.time}",
-            f"**Venue:** {self.venue}",
-        ]
+        lines: list[str] = []
+        self.append_markdown(lines)
+        return "\n".join(lines)
+
+    def append_markdown(self, lines: list[str]) -> None:
+        """Append the event's markdown lines to an existing list."""
+        lines.append(f"## {self.title}")
+        lines.append(f"**Date:** {self.date}")
+        lines.append(f"**Time:** {self.time}")
+        lines.append(f"**Venue:** {self.venue}")
 
         if self.genres:
             lines.append(f"**Genres:** {', '.join(self.genres)}")
@@ -58,23 +78,18 @@ class Event(BaseModel):
                 lines.append(f"  - [{text}]({url})")
 
         lines.append("\n---\n")
-        return "\n".join(lines)
 
     def matches_search(self, search_term: str) -> bool:
         """Check if event matches search term."""
-        search_lower = search_term.lower()
-        return (
-            search_lower in self.title.lower()
-            or search_lower in self.venue.lower()
-            or any(search_lower in g.lower() for g in self.genres)
-            or any(search_lower in o.lower() for o in self.organizers)
-        )
+        return search_term.lower() in self._search_blob
 
 
-class EventPage(BaseModel):
+@dataclass(slots=True)
+class EventPage:
     """A page of events with pagination info."""
 
     events: list[Event]
+    region: Region  # Resolved region the events were fetched from
     page: int
     page_size: int
     total_events: int
@@ -86,9 +101,11 @@ class EventPage(BaseModel):
         return max(1, (self.total_events + self.page_size - 1) // self.page_size)
 
     def format_markdown(
-        self, region_name: str, search_term: Optional[str] = None
+        self, region_name: Optional[str] = None, search_term: Optional[str] = None
     ) -> str:
-        """Format page as markdown response."""
+        """Format page as markdown response (region_name defaults to region.name)."""
+        if region_name is None:
+            region_name = self.region.name
         lines = [f"# Electronic Music Events - {region_name}"]
 
         if search_term:
@@ -98,8 +115,9 @@ class EventPage(BaseModel):
             f"\n**Page {self.page} of {self.total_pages}** ({self.total_events} total events)\n"
         )
 
+        # Events share the "\n" separator, so they append into the same list
         for event in self.events:
-            lines.append(event.format_markdown())
+            event.append_markdown(lines)
 
         if self.has_more:
             lines.append(f"\n*Use page={self.page + 1} to see more events*")
@@ -1,31 +1,79 @@
 """HTML parser for 19hz.info event listings."""
 
+import asyncio
+import functools
 import re
-from typing import Optional
+import time
+from typing import ClassVar, Mapping, Optional
 
 import httpx
-from selectolax.parser import HTMLParser
+from selectolax.lexbor import LexborHTMLParser as HTMLParser
+from selectolax.lexbor import LexborNode
 
 from models import Event, EventPage, Region
 
 
+@functools.lru_cache(maxsize=4096)
+def _make_absolute_url(url: Optional[str]) -> Optional[str]:
+    """Convert relative URL to absolute if needed (cached, links repeat)."""
+    if not url:
+        return None
+    if url.startswith("http"):
+        return url
+    if url.startswith("/"):
+        return f"{EventParser.BASE_URL}{url}"
+    return url
+
+
 class EventParser:
     """Parses 19hz.info event listing pages."""
 
     BASE_URL = "https://19hz.info"
     DEFAULT_PAGE_SIZE = 50
     MIN_CELLS_FOR_EVENT = 6
+    REQUEST_TIMEOUT = 10.0
+    MAX_CONNECTIONS = 20
+    CACHE_TTL = 300.0  # Seconds before a fetched page is considered stale
 
     # Regex patterns
-    DATE_PATTERN = re.compile(r"(Mon|Tue|Wed|Thu|Fri|Sat|Sun)[^\n]*")
+    # Date runs to end of line; time is the first parenthetical within it
+    DATETIME_PATTERN = re.compile(
+        r"(?P<date>(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun)[^\n(]*"
+        r"(?:\((?P<time>[^)\n]+)\))?[^\n]*)"
+    )
+    # Fallback when a parenthetical precedes the date or the first one is empty
     TIME_PATTERN = re.compile(r"\(([^)]+)\)")
-    PRICE_PATTERN = re.compile(r"\$[\d\.]+|free|donation", re.IGNORECASE)
-    AGE_PATTERN = re.compile(r"\b(21\+|18\+|All ages|\d+\+)", re.IGNORECASE)
-    VENUE_LOCATION_PATTERN = re.compile(r"\([^)]+\)$")
+    # Price sits in a lookahead so it doesn't consume an age (e.g. "$10+")
+    PRICE_AGE_PATTERN = re.compile(
+        r"(?=(?P<price>\$[\d\.]+|free|donation))"
+        r"|\b(?P<age>21\+|18\+|All ages|\d+\+)",
+        re.IGNORECASE,
+    )
+    REGION_FILENAME_PATTERN = re.compile(r"eventlisting_\w+\.php")
+
+    # Shared by events with no additional links; typed read-only, never mutated
+    EMPTY_LINKS: ClassVar[Mapping[str, str]] = {}
+
+    # CSS selectors (rows and cells are walked with iter() instead)
+    TABLE_BODY_SELECTOR = "tbody"
+    LINK_SELECTOR = "a"
+    REGION_LINK_SELECTOR = "a[href*='eventlisting']"
 
     def __init__(self, regions: dict[str, Region]):
         """Initialize parser with region configuration."""
         self.regions = regions
+        # Precomputed for _validate_region
+        self._regions_by_key = {key.lower(): r for key, r in regions.items()}
+        self._available_regions = ", ".join(regions.keys())
+        self._client: Optional[httpx.AsyncClient] = None
+        # URL -> (fetch time, html)
+        self._html_cache: dict[str, tuple[float, str]] = {}
+        # Region key -> (html hash, parsed events)
+        self._events_cache: dict[str, tuple[int, list[Event]]] = {}
+        # URL -> validators from the last 200 response, for conditional GETs
+        self._etag: dict[str, str] = {}
+        self._last_mod: dict[str, str] = {}
+        self._fetch_locks: dict[str, asyncio.Lock] = {}
 
     async def fetch_events(
         self,
@@ -36,33 +84,115 @@ class EventParser:
     ) -> EventPage:
         """Fetch and parse events for a specific region with pagination."""
         region = self._validate_region(region_key)
-        html = await self._fetch_page_html(region.url)
-        all_events = self._parse_events_html(html, region)
+        all_events = await self._get_region_events(region)
 
         # Apply search filter
         if search:
             all_events = [e for e in all_events if e.matches_search(search)]
 
         # Create paginated result
-        return self._paginate_events(all_events, page, page_size)
+        return self._paginate_events(all_events, region, page, page_size)
 
     def _validate_region(self, region_key: str) -> Region:
         """Validate and return region object."""
-        region_key_lower = region_key.lower()
-        if region_key_lower not in self.regions:
-            available = ", ".join(self.regions.keys())
-            raise ValueError(f"Invalid region. Available regions: {available}")
-        return self.regions[region_key_lower]
+        region = self._regions_by_key.get(region_key.lower())
+        if region is None:
+            raise ValueError(
+                f"Invalid region. Available regions: {self._available_regions}"
+            )
+        return region
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                follow_redirects=True,
+                timeout=httpx.Timeout(self.REQUEST_TIMEOUT),
+                limits=httpx.Limits(
+                    max_connections=self.MAX_CONNECTIONS,
+                    max_keepalive_connections=self.MAX_CONNECTIONS,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its connection pool."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _get_region_events(self, region: Region) -> list[Event]:
+        """Return parsed events for a region, reusing them if the page is unchanged."""
+        html = await self._fetch_page_html(region.url)
+        html_hash = hash(html)
+
+        cached = self._events_cache.get(region.key)
+        if cached and cached[0] == html_hash:
+            return cached[1]
+
+        events = self._parse_events_html(html, region)
+        self._events_cache[region.key] = (html_hash, events)
+        return events
+
+    def _get_cached_html(self, url: str) -> Optional[str]:
+        """Return cached HTML for URL if it is still fresh."""
+        cached = self._html_cache.get(url)
+        if cached and time.monotonic() - cached[0] < self.CACHE_TTL:
+            return cached[1]
+        return None
 
     async def _fetch_page_html(self, url: str) -> str:
-        """Fetch HTML content from URL."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, follow_redirects=True)
+        """Fetch HTML content from URL, served from cache while fresh."""
+        html = self._get_cached_html(url)
+        if html is not None:
+            return html
+
+        # Coalesce concurrent fetches of the same URL into one request
+        lock = self._fetch_locks.setdefault(url, asyncio.Lock())
+        async with lock:
+            html = self._get_cached_html(url)
+            if html is not None:
+                return html
+
+            cached = self._html_cache.get(url)
+            headers: dict[str, str] = {}
+            if cached:
+                if url in self._etag:
+                    headers["If-None-Match"] = self._etag[url]
+                if url in self._last_mod:
+                    headers["If-Modified-Since"] = self._last_mod[url]
+
+            response = await self._get_client().get(url, headers=headers)
+
+            # Page unchanged: keep the same HTML so parsed events are reused
+            if cached and response.status_code == httpx.codes.NOT_MODIFIED:
+                html = cached[1]
+                self._html_cache[url] = (time.monotonic(), html)
+                return html
+
             response.raise_for_status()
-            return response.text
+            html = response.text
+            self._html_cache[url] = (time.monotonic(), html)
+            self._store_validators(url, response)
+            return html
+
+    def _store_validators(self, url: str, response: httpx.Response) -> None:
+        """Remember ETag/Last-Modified headers for conditional requests."""
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etag[url] = etag
+        else:
+            self._etag.pop(url, None)
+
+        last_mod = response.headers.get("Last-Modified")
+        if last_mod:
+            self._last_mod[url] = last_mod
+        else:
+            self._last_mod.pop(url, None)
 
     def _paginate_events(
-        self, events: list[Event], page: int, page_size: int
+        self, events: list[Event], region: Region, page: int, page_size: int
     ) -> EventPage:
         """Create paginated event page."""
         total_events = len(events)
@@ -75,6 +205,7 @@ class EventParser:
 
         return EventPage(
             events=events[start_idx:end_idx],
+            region=region,
             page=page,
             page_size=page_size,
             total_events=total_events,
@@ -84,32 +215,39 @@ class EventParser:
     def _parse_events_html(self, html: str, region: Region) -> list[Event]:
         """Parse events from HTML table structure."""
         parser = HTMLParser(html)
-        events = []
+        events: list[Event] = []
 
-        for row in parser.css("tbody tr"):
-            event = self._parse_event_row(row, region)
-            if event:
-                events.append(event)
+        # Walk table rows directly rather than matching a selector per row
+        for tbody in parser.css(self.TABLE_BODY_SELECTOR):
+            for row in tbody.iter(include_text=False):
+                if row.tag != "tr":
+                    continue
+                event = self._parse_event_row(row, region)
+                if event:
+                    events.append(event)
 
         return events
 
-    def _parse_event_row(self, row, region: Region) -> Optional[Event]:
+    def _parse_event_row(self, row: LexborNode, region: Region) -> Optional[Event]:
         """Parse a single event from a table row."""
-        cells = row.css("td")
+        cells = [cell for cell in row.iter(include_text=False) if cell.tag == "td"]
 
         if len(cells) < self.MIN_CELLS_FOR_EVENT:
             return None
 
+        # Serialize each text cell once and share it between extractors
+        texts = [cell.text(deep=True, strip=True) for cell in cells[:5]]
+
         # Extract data from each cell
-        date, time = self._extract_datetime(cells[0])
+        date, time = self._extract_datetime(texts[0])
         if not date:  # No valid date means not an event row
             return None
 
-        title, url = self._extract_title_and_url(cells[1])
-        venue = self._extract_venue(cells[1])
-        genres = self._extract_genres(cells[2])
-        price, age = self._extract_price_and_age(cells[3])
-        organizers = self._extract_organizers(cells[4])
+        title, url = self._extract_title_and_url(cells[1], texts[1])
+        venue = self._extract_venue(texts[1])
+        genres = self._extract_genres(texts[2])
+        price, age = self._extract_price_and_age(texts[3])
+        organizers = self._extract_organizers(texts[4])
         additional_links = self._extract_additional_links(
             cells[5] if len(cells) > 5 else None
         )
@@ -128,107 +266,113 @@ class EventParser:
             additional_links=additional_links,
         )
 
-    def _extract_datetime(self, cell) -> tuple[Optional[str], str]:
-        """Extract date and time from date/time cell."""
-        text = cell.text(deep=True, strip=True)
+    def _extract_datetime(self, text: str) -> tuple[Optional[str], str]:
+        """Extract date and time from date/time cell text.
 
-        # Extract date
-        date_match = self.DATE_PATTERN.search(text)
-        if not date_match:
+        Usually one DATETIME_PATTERN search. A second TIME_PATTERN search runs
+        only when the time group can't be trusted to hold the first
+        parenthetical: one precedes the date, or the first is empty or
+        spans lines.
+        """
+        match = self.DATETIME_PATTERN.search(text)
+        if not match:
             return None, "TBA"
 
-        date = date_match.group(0)
-
-        # Extract time from parentheses
-        time_match = self.TIME_PATTERN.search(text)
-        time = time_match.group(1) if time_match else "TBA"
+        time = match.group("time")
+        if time is None or text.find("(", 0, match.start()) != -1:
+            time_match = self.TIME_PATTERN.search(text)
+            time = time_match.group(1) if time_match else None
 
-        return date, time
+        return match.group("date"), time or "TBA"
 
-    def _extract_title_and_url(self, cell) -> tuple[str, Optional[str]]:
+    def _extract_title_and_url(
+        self, cell: LexborNode, text: str
+    ) -> tuple[str, Optional[str]]:
         """Extract event title and primary URL from title/venue cell."""
         # Try to get from link first
-        link = cell.css_first("a")
+        link = cell.css_first(self.LINK_SELECTOR)
         if link:
             title = link.text(strip=True)
-            url = self._make_absolute_url(link.attributes.get("href", ""))
+            url = _make_absolute_url(link.attributes.get("href", ""))
             return title, url
 
         # Fallback to text before @ symbol
-        text = cell.text(deep=True, strip=True)
         title = text.split("@")[0].strip() if "@" in text else "Event"
         return title, None
 
-    def _extract_venue(self, cell) -> str:
-        """Extract venue from title/venue cell."""
-        text = cell.text(deep=True, strip=True)
+    def _extract_venue(self, text: str) -> str:
+        """Extract venue from title/venue cell text."""
         if "@" not in text:
             return "TBA"
 
         venue = text.split("@", 1)[1].strip()
         # Remove location in parentheses (e.g., "(San Francisco)")
-        venue = self.VENUE_LOCATION_PATTERN.sub("", venue).strip()
+        if venue.endswith(")"):
+            # Earliest "(" after any other ")" opens the trailing group
+            start = venue.find("(", venue.rfind(")", 0, -1) + 1, -2)
+            if start != -1:
+                venue = venue[:start].strip()
         return venue
 
-    def _extract_genres(self, cell) -> list[str]:
-        """Extract genres from genres cell."""
-        text = cell.text(deep=True, strip=True)
-        return [g.strip() for g in text.split(",") if g.strip()]
+    def _extract_genres(self, text: str) -> list[str]:
+        """Extract genres from genres cell text."""
+        return [g for g in map(str.strip, text.split(",")) if g]
 
-    def _extract_price_and_age(self, cell) -> tuple[Optional[str], Optional[str]]:
-        """Extract price and age restriction from price/age cell."""
-        text = cell.text(deep=True, strip=True)
+    def _extract_price_and_age(self, text: str) -> tuple[Optional[str], Optional[str]]:
+        """Extract price and age restriction from price/age cell text."""
+        price = None
+        age = None
 
-        price_match = self.PRICE_PATTERN.search(text)
-        price = price_match.group(0) if price_match else None
-
-        age_match = self.AGE_PATTERN.search(text)
-        age = age_match.group(0) if age_match else None
+        # Single scan: take the first price and first age, whichever comes first
+        for match in self.PRICE_AGE_PATTERN.finditer(text):
+            if match.lastgroup == "price":
+                price = price or match.group("price")
+            else:
+                age = age or match.group("age")
+            if price and age:
+                break
 
         return price, age
 
-    def _extract_organizers(self, cell) -> list[str]:
-        """Extract organizers from organizers cell."""
-        text = cell.text(deep=True, strip=True)
-        return [o.strip() for o in text.split(",") if o.strip()]
+    def _extract_organizers(self, text: str) -> list[str]:
+        """Extract organizers from organizers cell text."""
+        return [o for o in map(str.strip, text.split(",")) if o]
 
-    def _extract_additional_links(self, cell) -> dict[str, str]:
+    def _extract_additional_links(
+        self, cell: Optional[LexborNode]
+    ) -> Mapping[str, str]:
         """Extract additional links from links cell."""
         if not cell:
-            return {}
+            return self.EMPTY_LINKS
 
-        links = {}
-        for link in cell.css("a"):
+        # Only allocate a dict once the cell turns out to have a usable link
+        links: Optional[dict[str, str]] = None
+        for link in cell.css(self.LINK_SELECTOR):
             text = link.text(strip=True)
-            url = self._make_absolute_url(link.attributes.get("href", ""))
+            url = _make_absolute_url(link.attributes.get("href", ""))
             if text and url:
+                if links is None:
+                    links = {}
                 links[text] = url
 
-        return links
-
-    def _make_absolute_url(self, url: str) -> Optional[str]:
-        """Convert relative URL to absolute if needed."""
-        if not url:
-            return None
-        if url.startswith("http"):
-            return url
-        if url.startswith("/"):
-            return f"{self.BASE_URL}{url}"
-        return url
+        return links if links is not None else self.EMPTY_LINKS
 
     async def check_for_new_regions(self) -> tuple[list[str], list[str]]:
         """Check the main page for any new regions not in our list."""
         html = await self._fetch_page_html(self.BASE_URL)
-        parser = HTMLParser(html)
-
-        found_regions = []
         known_filenames = {r.filename for r in self.regions.values()}
 
-        for link in parser.css("a[href*='eventlisting']"):
-            href = link.attributes.get("href")
-            if href and "eventlisting" in href:
-                filename = href.split("/")[-1].split("?")[0]
-                found_regions.append(filename)
+        # Listing filenames follow a fixed pattern, so scan for them directly
+        found_regions = self.REGION_FILENAME_PATTERN.findall(html)
+
+        # Fall back to walking the links if the page layout changed
+        if not found_regions:
+            parser = HTMLParser(html)
+            for link in parser.css(self.REGION_LINK_SELECTOR):
+                href = link.attributes.get("href")
+                if href and "eventlisting" in href:
+                    filename = href.split("/")[-1].split("?")[0]
+                    found_regions.append(filename)
 
         unique_found = list(set(found_regions))
         new_regions = [f for f in unique_found if f not in known_filenames]
@@ -6,12 +6,16 @@ from 19hz.info, a comprehensive event calendar for electronic music across
 North America.
 """
 
+import asyncio
 import os
 import sys
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
 
+import uvicorn
 from fastmcp import FastMCP
 from pydantic import Field
+from starlette.applications import Starlette
 
 from constants import REGIONS
 from parser import EventParser
@@ -51,9 +55,7 @@ async def get_events(
     """
     try:
         page_result = await parser.fetch_events(region, page, page_size, search)
-        region_obj = REGIONS.get(region.lower())
-        region_name = region_obj.name if region_obj else region.upper()
-        return page_result.format_markdown(region_name, search)
+        return page_result.format_markdown(search_term=search)
     except ValueError as e:
         return str(e)
     except Exception as e:
@@ -81,35 +83,45 @@ async def search_all_regions(
 
     Returns matching events from all regions, limited to max_per_region per region.
     """
-    output = f"# Search Results for '{search_term}'\n\n"
+    parts: list[str] = [f"# Search Results for '{search_term}'\n\n"]
     total_found = 0
 
-    for region in REGIONS.values():
-        try:
-            # Fetch first page with search
-            page_result = await parser.fetch_events(
+    # Fetch first page with search for every region concurrently
+    regions = list(REGIONS.values())
+    results = await asyncio.gather(
+        *[
+            parser.fetch_events(
                 region.key, page=1, page_size=max_per_region, search=search_term
             )
-
-            if page_result.events:
-                output += f"\n## {region.name} ({page_result.total_events} matches)\n"
-                for event in page_result.events:
-                    output += f"- **{event.date}** - {event.title} @ {event.venue}\n"
-                    if event.url:
-                        output += f"  [{event.url}]({event.url})\n"
-                total_found += page_result.total_events
-
-        except Exception as e:
+            for region in regions
+        ],
+        return_exceptions=True,
+    )
+
+    for region, page_result in zip(regions, results):
+        # Cancellation comes back as a BaseException; don't report it as an error
+        if isinstance(page_result, asyncio.CancelledError):
+            raise page_result
+        if isinstance(page_result, BaseException):
             # Log error but continue with other regions
-            output += f"\n## {region.name}\n"
-            output += f"Error: {str(e)}\n"
+            parts.append(f"\n## {region.name}\n")
+            parts.append(f"Error: {str(page_result)}\n")
+            continue
+
+        if page_result.events:
+            parts.append(f"\n## {region.name} ({page_result.total_events} matches)\n")
+            for event in page_result.events:
+                parts.append(f"- **{event.date}** - {event.title} @ {event.venue}\n")
+                if event.url:
+                    parts.append(f"  [{event.url}]({event.url})\n")
+            total_found += page_result.total_events
 
     if total_found == 0:
-        output += "No events found matching your search."
+        parts.append("No events found matching your search.")
     else:
-        output += f"\n**Total matches across all regions: {total_found}**"
+        parts.append(f"\n**Total matches across all regions: {total_found}**")
 
-    return output
+    return "".join(parts)
 
 
 @mcp.tool()
@@ -141,22 +153,43 @@ async def check_for_new_regions() -> str:
 
 # Create ASGI app for uvicorn (serves at /mcp by default)
 app = mcp.http_app()
+_mcp_lifespan = app.router.lifespan_context
+
+
+@asynccontextmanager
+async def app_lifespan(app: Starlette) -> AsyncIterator[None]:
+    """Run the MCP app lifespan, closing the shared HTTP client at shutdown.
+
+    FastMCP's own lifespan runs once per MCP session, so the client is closed
+    here, once per process, rather than there.
+    """
+    try:
+        async with _mcp_lifespan(app):
+            yield
+    finally:
+        await parser.aclose()
+
+
+app.router.lifespan_context = app_lifespan
+
+
+async def run_stdio() -> None:
+    """Serve over stdio, closing the shared HTTP client on exit."""
+    try:
+        await mcp.run_async(transport="stdio")
+    finally:
+        await parser.aclose()
 
 
 def main():
     """Run the MCP server."""
     # Check for stdio mode
     if "--stdio" in sys.argv:
-        mcp.run(transport="stdio")
+        asyncio.run(run_stdio())
     else:
-        # Default to HTTP mode
+        # Default to HTTP mode, serving the app above so its lifespan applies
         port = int(os.environ.get("PORT", "8000"))
-        mcp.run(
-            transport="http",
-            host="127.0.0.1",
-            port=port,
-            path="/mcp",
-        )
+        uvicorn.run(app, host="127.0.0.1", port=port)
 
 
 if __name__ == "__main__":